@@ -138,7 +138,21 @@ class TaskManager(ABC):
             if self._extra_pipeline_options is not None:
                 for k, v in self._extra_pipeline_options.items():
                     options[k] = v
-        self._pipeline: Pipeline = pipeline(task=self.task, dataset_size = self.dataset_size, **options)
+        self._pipeline_class: Type[Pipeline] = pipeline
+        self._pipeline_init_kwargs: Dict = {"task": self.task, "dataset_size": self.dataset_size, **options}
+        self._pipeline: Pipeline = self._make_pipeline()
+
+    def _make_pipeline(self) -> Pipeline:
+        """
+        Constructs a new (unfitted) pipeline using the same arguments as the one created during initialization.
+        This is cheaper than copying an existing pipeline.
+
+        Returns
+        -------
+        Pipeline
+            new pipeline instance
+        """
+        return self._pipeline_class(**self._pipeline_init_kwargs)
 
     def save_model(self, filename: Optional[str] = None, **kwargs: Any) -> ModelProto:
         """
@@ -19,7 +19,7 @@ from sklearn.utils.validation import check_is_fitted
 from sklearn.utils.validation import check_scalar
 from sklearn.utils.fixes import delayed
 from sklearn.ensemble import StackingClassifier
-from types import MethodType
+from functools import partial
 from falcon.addons.sklearn.model_selection.balanced_strat_kfold import (
     BalancedStratifiedKFold,
 )
@@ -158,10 +158,11 @@ class _EncoderPlaceholder(LabelEncoder):
 
 
 # the object is being patched with a new method instead of subclassing
-# so the estimator can be converted to ONNX using the default converter
+# so the estimator can be converted to ONNX using the default converter;
+# a partial is used instead of a bound method so the estimator remains picklable
 def BalancedStackingClassifier(estimators, final_estimator, **kwargs):
     clf = StackingClassifier(estimators, final_estimator, **kwargs)
-    clf.fit = MethodType(_fit, clf)
+    clf.fit = partial(_fit, clf)
     if version.parse(sklearn_version) >= version.parse("1.2.0"):
         clf._label_encoder = _EncoderPlaceholder()
     return clf
@@ -28,9 +28,9 @@ class _FalconBaseEstimator(_BaseEstimator):
             configuration to be used, by default "SuperLearner"
         eval_strategy : Optional[Union[str, Callable, BaseCrossValidator]], optional
             evaluation strategy, can be one of {'auto', 'holdout' 'cv', BaseCrossValidator, Callable} by default 'dynamic'.
-            If 'auto', uses 5 fold CV for small datasets and holdout for large ones.
+            If 'auto', uses 3 fold CV for small datasets and holdout for large ones.
             If 'holdout', uses holdout strategy with 25% of data for validation.
-            If 'cv', uses 5 fold CV.
+            If 'cv', uses 3 fold CV.
             If BaseCrossValidator, uses the specified cross-validator.
             If Callable, uses the specified function to split data into train and validation sets.
             If None, no evaluation will be performed.
@@ -1,3 +1,9 @@
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
 from falcon.tabular.pipelines import SimpleTabularPipeline
 from falcon.tabular.learners import SuperLearner, OptunaLearner, PlainLearner
 from falcon.tabular.learners.super_learner import _default_estimators
@@ -5,145 +11,191 @@ from falcon.tabular.models.hist_gbt import (
     HistGradientBoostingClassifier,
     HistGradientBoostingRegressor,
 )
-from typing import Dict
 
-_SUPER_LEARNER_DEFAULT_CONFIG = {
-    "pipeline": SimpleTabularPipeline,
-    "extra_pipeline_options": {"learner": SuperLearner, "learner_kwargs": {}},
-}
 
-_OPTUNA_LEARNER_DEFAULT_CONFIG = {
-    "pipeline": SimpleTabularPipeline,
-    "extra_pipeline_options": {"learner": OptunaLearner, "learner_kwargs": {}},
-}
+class _FrozenList(tuple):
+    """
+    Immutable replacement of a list, converted back to a list by `_thaw`.
+    """
 
-_PLAIN_LEARNER_DEFAULT_CONFIG = {
-    "pipeline": SimpleTabularPipeline,
-    "extra_pipeline_options": {"learner": PlainLearner, "learner_kwargs": {}},
-}
 
-TABULAR_CLASSIFICATION_CONFIGURATIONS: Dict[str, Dict] = {
-    "SuperLearner.mini": {
-        "pipeline": SimpleTabularPipeline,
-        "extra_pipeline_options": {
-            "learner": SuperLearner,
-            "learner_kwargs": {
-                "cv": 10,
-                "base_estimators": _default_estimators["tabular_classification"][
-                    "mini"
-                ],
-            },
-        },
-    },
-    "SuperLearner.mid": {
-        "pipeline": SimpleTabularPipeline,
-        "extra_pipeline_options": {
-            "learner": SuperLearner,
-            "learner_kwargs": {
-                "cv": 5,
-                "base_estimators": _default_estimators["tabular_classification"]["mid"],
-            },
-        },
-    },
-    "SuperLearner.large": {
-        "pipeline": SimpleTabularPipeline,
-        "extra_pipeline_options": {
-            "learner": SuperLearner,
-            "learner_kwargs": {
-                "cv": 3,
-                "base_estimators": _default_estimators["tabular_classification"][
-                    "large"
-                ],
-            },
-        },
-    },
-    "SuperLearner.xlarge": {
-        "pipeline": SimpleTabularPipeline,
-        "extra_pipeline_options": {
-            "learner": SuperLearner,
-            "learner_kwargs": {
-                "cv": 3,
-                "base_estimators": _default_estimators["tabular_classification"][
-                    "x-large"
-                ],
-            },
-        },
-    },
-    "OptunaLearner.hgbt": {
-        "pipeline": SimpleTabularPipeline,
-        "extra_pipeline_options": {
-            "learner": OptunaLearner,
-            "learner_kwargs": {"model_class": HistGradientBoostingClassifier},
-        },
-    },
-    "PlainLearner.hgbt": {
-        "pipeline": SimpleTabularPipeline,
-        "extra_pipeline_options": {
-            "learner": PlainLearner,
-            "learner_kwargs": {"model_class": HistGradientBoostingClassifier},
-        },
-    },
-    "SuperLearner": _SUPER_LEARNER_DEFAULT_CONFIG,
-    "OptunaLearner": _OPTUNA_LEARNER_DEFAULT_CONFIG,
-    "PlainLearner": _PLAIN_LEARNER_DEFAULT_CONFIG,
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return _FrozenList(_freeze(v) for v in value)
+    if isinstance(value, tuple):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, _FrozenList):
+        return [_thaw(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_thaw(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class TabularConfig:
+    """
+    Immutable record of a predefined tabular configuration.
+    """
+
+    __slots__ = ("pipeline", "extra_pipeline_options")
+
+    pipeline: Type
+    extra_pipeline_options: Mapping
+
+    def to_dict(self) -> Dict:
+        """
+        Returns
+        -------
+        Dict
+            the configuration as (mutable) keyword arguments for the task manager
+        """
+        return {
+            "pipeline": self.pipeline,
+            "extra_pipeline_options": _thaw(self.extra_pipeline_options),
+        }
+
+
+def _make(learner: Type, **learner_kwargs: Any) -> TabularConfig:
+    return TabularConfig(
+        pipeline=SimpleTabularPipeline,
+        extra_pipeline_options=_freeze(
+            {"learner": learner, "learner_kwargs": learner_kwargs}
+        ),
+    )
+
+
+def _sl(task: str, size: str, cv: int) -> TabularConfig:
+    return _make(
+        SuperLearner, cv=cv, base_estimators=_default_estimators[task][size]
+    )
+
+
+def _task_factories(
+    task: str, hgbt_model: Type
+) -> Dict[str, Callable[[], TabularConfig]]:
+    return {
+        "SuperLearner.mini": lambda: _sl(task, "mini", 10),
+        "SuperLearner.mid": lambda: _sl(task, "mid", 5),
+        "SuperLearner.large": lambda: _sl(task, "large", 3),
+        "SuperLearner.xlarge": lambda: _sl(task, "x-large", 3),
+        "OptunaLearner.hgbt": lambda: _make(OptunaLearner, model_class=hgbt_model),
+        "PlainLearner.hgbt": lambda: _make(PlainLearner, model_class=hgbt_model),
+        "SuperLearner": lambda: _make(SuperLearner),
+        "OptunaLearner": lambda: _make(OptunaLearner),
+        "PlainLearner": lambda: _make(PlainLearner),
+    }
+
+
+_TASK_FACTORIES = {
+    "tabular_classification": _task_factories(
+        "tabular_classification", HistGradientBoostingClassifier
+    ),
+    "tabular_regression": _task_factories(
+        "tabular_regression", HistGradientBoostingRegressor
+    ),
 }
 
-TABULAR_REGRESSION_CONFIGURATIONS: Dict[str, Dict] = {
-    "SuperLearner.mini": {
-        "pipeline": SimpleTabularPipeline,
-        "extra_pipeline_options": {
-            "learner": SuperLearner,
-            "learner_kwargs": {
-                "cv": 10,
-                "base_estimators": _default_estimators["tabular_regression"]["mini"],
-            },
-        },
-    },
-    "SuperLearner.mid": {
-        "pipeline": SimpleTabularPipeline,
-        "extra_pipeline_options": {
-            "learner": SuperLearner,
-            "learner_kwargs": {
-                "cv": 5,
-                "base_estimators": _default_estimators["tabular_regression"]["mid"],
-            },
-        },
-    },
-    "SuperLearner.large": {
-        "pipeline": SimpleTabularPipeline,
-        "extra_pipeline_options": {
-            "learner": SuperLearner,
-            "learner_kwargs": {
-                "cv": 3,
-                "base_estimators": _default_estimators["tabular_regression"]["large"],
-            },
-        },
-    },
-    "SuperLearner.xlarge": {
-        "pipeline": SimpleTabularPipeline,
-        "extra_pipeline_options": {
-            "learner": SuperLearner,
-            "learner_kwargs": {
-                "cv": 3,
-                "base_estimators": _default_estimators["tabular_regression"]["x-large"],
-            },
-        },
-    },
-    "OptunaLearner.hgbt": {
-        "pipeline": SimpleTabularPipeline,
-        "extra_pipeline_options": {
-            "learner": OptunaLearner,
-            "learner_kwargs": {"model_class": HistGradientBoostingRegressor},
-        },
-    },
-    "PlainLearner.hgbt": {
-        "pipeline": SimpleTabularPipeline,
-        "extra_pipeline_options": {
-            "learner": PlainLearner,
-            "learner_kwargs": {"model_class": HistGradientBoostingRegressor},
-        },
-    },
-    "SuperLearner": _SUPER_LEARNER_DEFAULT_CONFIG,
-    "OptunaLearner": _OPTUNA_LEARNER_DEFAULT_CONFIG,
-    "PlainLearner": _PLAIN_LEARNER_DEFAULT_CONFIG,
+# configuration names are shared by all tasks and mapped to their position in the per task tables
+_CONFIG_NAMES: Mapping = MappingProxyType(
+    {
+        sys.intern(name): i
+        for i, name in enumerate(_TASK_FACTORIES["tabular_classification"])
+    }
+)
+
+_CONFIG_FACTORIES: Mapping = MappingProxyType(
+    {
+        task: tuple(factories[name] for name in _CONFIG_NAMES)
+        for task, factories in _TASK_FACTORIES.items()
+    }
+)
+
+# the configurations are stored in the table once they are built
+_CONFIG_TABLE: Dict[str, List[Optional[TabularConfig]]] = {
+    task: [None] * len(_CONFIG_NAMES) for task in _CONFIG_FACTORIES
 }
+
+
+def get_config(task: str, name: str) -> TabularConfig:
+    """
+    Builds the configuration on first use; subsequent calls return the same (immutable) object.
+
+    Parameters
+    ----------
+    task : str
+        `tabular_classification` or `tabular_regression`
+    name : str
+        the name of the configuration (e.g. `SuperLearner.mini`)
+
+    Returns
+    -------
+    TabularConfig
+        the configuration
+    """
+    if task not in _CONFIG_TABLE:
+        raise ValueError(f"Unknown task `{task}`")
+    index = _CONFIG_NAMES[name]
+    config = _CONFIG_TABLE[task][index]
+    if config is None:
+        config = _CONFIG_TABLE[task][index] = _CONFIG_FACTORIES[task][index]()
+    return config
+
+
+@lru_cache(maxsize=None)
+def get_pipeline_constructor(task: str, name: str) -> Callable:
+    """
+    Specializes the pipeline class of the configuration by pre-binding the learner and its arguments.
+    Subsequent calls return the same constructor, which only needs the data dependent arguments (e.g. `task`, `dataset_size`, `mask`).
+
+    Parameters
+    ----------
+    task : str
+        `tabular_classification` or `tabular_regression`
+    name : str
+        the name of the configuration (e.g. `SuperLearner.mini`)
+
+    Returns
+    -------
+    Callable
+        pipeline constructor
+    """
+    config = get_config(task, name).to_dict()
+    # the options are thawed, since the pipelines keep them as attributes and have to remain picklable
+    return partial(config["pipeline"], **config["extra_pipeline_options"])
+
+
+class _TaskConfigurations(Mapping):
+    """
+    Read-only mapping of configuration names to configurations of a given task.
+    The configurations are resolved through `get_config` and returned as dictionaries.
+    """
+
+    def __init__(self, task: str) -> None:
+        self._task = task
+
+    def __getitem__(self, name: str) -> Dict:
+        return get_config(self._task, name).to_dict()
+
+    def __contains__(self, name: object) -> bool:
+        return name in _CONFIG_NAMES
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_CONFIG_NAMES)
+
+    def __len__(self) -> int:
+        return len(_CONFIG_NAMES)
+
+
+TABULAR_CLASSIFICATION_CONFIGURATIONS: Mapping = _TaskConfigurations(
+    "tabular_classification"
+)
+
+TABULAR_REGRESSION_CONFIGURATIONS: Mapping = _TaskConfigurations("tabular_regression")
@@ -23,8 +23,14 @@ def scale_acc(acc: float, n_classes: int) -> float:
 
 def print_classification_report(y: npt.NDArray, y_hat: npt.NDArray, silent: bool = False) -> Dict:
     y = y.astype(np.str_)
-    classification_report = metrics.classification_report(y, y_hat, output_dict=True)
-    n_classes, n_samples = len(np.unique(y)), len(y)
+    # the labels are encoded as integers only once, so that the metrics below do not have to sort/compare strings
+    n_samples = len(y)
+    labels, codes = np.unique(np.concatenate([y, np.asarray(y_hat).astype(np.str_)]), return_inverse=True)
+    y, y_hat = codes[:n_samples], codes[n_samples:]
+    classification_report = metrics.classification_report(
+        y, y_hat, labels=np.arange(len(labels)), target_names=labels, output_dict=True
+    )
+    n_classes = len(np.unique(y))
     metrics_ = {
         'N_SAMPLES': n_samples, 
         'N_CLASSES': n_classes,
@@ -111,13 +117,14 @@ def print_classification_report(y: npt.NDArray, y_hat: npt.NDArray, silent: bool
 
 def print_regression_report(y: npt.NDArray, y_hat: npt.NDArray, silent: bool = False) -> Dict:
     diff = y-y_hat
+    mse = np.mean((diff) ** 2)
     metrics_ = {
         'N_SAMPLES': len(y),
         'R2': metrics.r2_score(y, y_hat), 
-        'RMSE': np.sqrt(np.mean((diff) ** 2)), 
-        'MSE': np.mean((diff) ** 2), 
+        'RMSE': np.sqrt(mse), 
+        'MSE': mse, 
         'MAE': np.mean(np.abs(diff)),
-        'RMSLE': np.log(np.sqrt(np.mean((diff) ** 2)) + 1e-7)
+        'RMSLE': np.log(np.sqrt(mse) + 1e-7)
     }
     metrics_['SCORE'] = metrics_['R2'] if metrics_['R2'] > 0.0 else 0.0 
     metrics_['SC_SCORE'] = (metrics_['SCORE'] + 1) / 2
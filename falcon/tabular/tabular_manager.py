@@ -1,19 +1,30 @@
 from __future__ import annotations
 from falcon.abstract import TaskManager, Pipeline
 from falcon.tabular.pipelines.simple_tabular_pipeline import SimpleTabularPipeline
-from falcon.tabular.utils import convert_to_np_obj
+from falcon.tabular.configurations import get_pipeline_constructor
+from falcon.tabular.utils import (
+    read_data,
+    split_features,
+    clean_data_split,
+    convert_to_np_obj,
+    fingerprint_file,
+    tab_cv_score,
+)
 from .reporting import print_classification_report, print_regression_report
-from falcon.tabular.utils import *
 from falcon.type_guessing import determine_column_types
 from falcon import types as ft
 from falcon.types import ColumnTypes
-from typing import Union, Optional, List, Tuple, Type, Dict, Any
+from typing import Union, Optional, List, Tuple, Type, Dict, Any, Callable
+import numpy as np
 from numpy import typing as npt
 import pandas as pd
-from falcon.utils import print_, set_verbosity_level
-from sklearn.model_selection import train_test_split
-import os
-import pandas as pd
+import joblib
+from falcon.utils import print_, quiet_verbosity
+from falcon.runtime import ONNXRuntime
+from sklearn.model_selection import train_test_split, BaseCrossValidator
+
+def _is_numeric_mask(mask: List[ColumnTypes]) -> bool:
+    return all(t == ColumnTypes.NUMERIC_REGULAR for t in mask)
 
 
 class TabularTaskManager(TaskManager):
@@ -31,6 +42,8 @@ class TabularTaskManager(TaskManager):
         features: Optional[ft.ColumnsList] = None,
         target: Optional[Union[str, int]] = None,
         eval_strategy: Optional[Union[str, BaseCrossValidator, Callable]] = "auto",
+        config: Optional[Union[str, Dict]] = None,
+        n_jobs: Optional[int] = None,
         **options: Any,
     ) -> None:
         """
@@ -61,15 +74,45 @@ class TabularTaskManager(TaskManager):
             If `features` argument is not None, target should be specified explicitly as well
         eval_strategy : Optional[Union[str, BaseCrossValidator, Callable]], optional
             evaluation strategy, can be one of {'auto', 'holdout' 'cv', BaseCrossValidator, Callable} by default 'auto'.
-            If 'auto', uses 5 fold CV for small datasets and holdout for large ones.
+            If 'auto', uses 3 fold CV for small datasets and holdout for large ones.
             If 'holdout', uses holdout strategy with 25% of data for validation.
-            If 'cv', uses 5 fold CV.
+            If 'cv', uses 3 fold CV.
             If BaseCrossValidator, uses the specified cross-validator.
             If Callable, uses the specified function to split data into train and validation sets.
             If None, no evaluation will be performed.
+        config : Optional[Union[str, Dict]], optional
+            name of a predefined configuration (e.g. `SuperLearner.mini`) or a configuration dictionary, by default None.
+            For a name, the pipeline is built by a constructor specialized for this configuration;
+            a dictionary may contain the `pipeline`, `pipeline_options` and `extra_pipeline_options` keys.
+            This argument cannot be combined with `pipeline`, `pipeline_options` or `extra_pipeline_options`
+        n_jobs : Optional[int], optional
+            number of parallel jobs used to fit the cross-validation folds, by default None (sequential)
         """
         print_(f"\nInitializing a new TabularTaskManager for task `{task}`")
+        if config is not None:
+            if (pipeline, pipeline_options, extra_pipeline_options) != (None, None, None):
+                raise ValueError(
+                    "`config` cannot be combined with `pipeline`, `pipeline_options` or `extra_pipeline_options`"
+                )
+            if isinstance(config, dict):
+                unknown = set(config) - {"pipeline", "pipeline_options", "extra_pipeline_options"}
+                if unknown:
+                    raise ValueError(f"Unexpected keys in `config`: {sorted(unknown)}")
+                pipeline = config.get("pipeline")
+                pipeline_options = config.get("pipeline_options")
+                extra_pipeline_options = config.get("extra_pipeline_options")
+            elif isinstance(config, str):
+                try:
+                    pipeline = get_pipeline_constructor(task, config)  # type: ignore
+                except KeyError:
+                    raise ValueError(f"Configuration `{config}` does not exist") from None
+            else:
+                raise ValueError(
+                    f"`config` should be a configuration name or a dictionary, got {type(config).__name__}"
+                )
         self._data: Tuple[npt.NDArray, npt.NDArray, List[ColumnTypes]]
+        self._prep_cache: Dict[bytes, Tuple[Tuple[npt.NDArray, npt.NDArray, List[ColumnTypes]], Tuple]] = {}
+        self._inference_only: bool = False
         # self._pipeline: Pipeline
         super().__init__(
             task=task,
@@ -82,8 +125,10 @@ class TabularTaskManager(TaskManager):
         )
 
         self._eval_set: Optional[Tuple] = None
+        self._compiled: Optional[ONNXRuntime] = None
         self._stored_cv_score: Optional[Dict] = None
         self.eval_strategy = eval_strategy
+        self.n_jobs = n_jobs
         if not self._validate_eval_strategy():
             raise ValueError(
                 f"Invalid value for `eval_strategy` argument: {self.eval_strategy}"
@@ -130,6 +175,16 @@ class TabularTaskManager(TaskManager):
         Tuple[npt.NDArray, npt.NDArray, List[ColumnTypes]]
             tuple of features, target and type mask for features
         """
+        # evaluation data read from a file is cached, so that repeated evaluation on the same file does not prepare it again;
+        # only the last file is kept, and in-memory data is not cached since it would have to be hashed on every call.
+        # The attributes updated during the preparation are cached as well and restored on a hit
+        fingerprint = None
+        if not training and isinstance(data, str):
+            fingerprint = fingerprint_file(data, self.features, self.target)
+            if fingerprint in self._prep_cache:
+                prepared, state = self._prep_cache[fingerprint]
+                self.features, self.feature_names_to_save, self.dataset_size = state
+                return prepared
         if isinstance(data, str):
             data = read_data(data)
             self._infer_feature_names(data)
@@ -162,12 +217,26 @@ class TabularTaskManager(TaskManager):
         mask: List[ColumnTypes]
         if training:
             mask = determine_column_types(X)
+            numeric_only = _is_numeric_mask(mask)
         else:
             mask = []
-        if len(y.shape) == 2:
-            y = y.ravel()
+            numeric_only = self._is_numeric_only
+        if numeric_only:
+            # object arrays take ~4x more memory than float64;
+            # float64 (unlike float32) keeps the values exact, the same dtype is used by `predict`
+            X = X.astype(np.float64)
+        if y.ndim == 2:
+            # unlike `ravel()`, `reshape` returns a view for strided (n, 1) columns as well
+            y = y.reshape(-1)
+        if fingerprint is not None:
+            state = (self.features, self.feature_names_to_save, self.dataset_size)
+            self._prep_cache = {fingerprint: ((X, y, mask), state)}
         return X, y, mask
 
+    @property
+    def _is_numeric_only(self) -> bool:
+        return _is_numeric_mask(self._data[2])
+
     @property
     def default_pipeline(self) -> Type[Pipeline]:
         """
@@ -191,7 +260,7 @@ class TabularTaskManager(TaskManager):
             else None
         )
         scores = tab_cv_score(
-            self._pipeline, self._data[0], self._data[1], self.task, cv=cv
+            self._make_pipeline, self._data[0], self._data[1], self.task, cv=cv, n_jobs=self.n_jobs
         )
         scores["N_SAMPLES"] = self.dataset_size[0]
         self._stored_cv_score = scores
@@ -205,7 +274,12 @@ class TabularTaskManager(TaskManager):
         TabularTaskManager
             `self`
         """
+        if self._inference_only:
+            raise RuntimeError(
+                "The manager was loaded using `from_file` and can only be used for inference."
+            )
         print_("Beginning training")
+        self._compiled = None
         if self.eval_strategy is not None:
             eval_strategy = self.eval_strategy
             split_fn = None
@@ -220,6 +294,7 @@ class TabularTaskManager(TaskManager):
                     X,
                     y,
                     test_size=0.25,
+                    random_state=42,
                     stratify=y if self.task == "tabular_classification" else None,
                 )
             elif callable(eval_strategy) and not isinstance(
@@ -238,7 +313,8 @@ class TabularTaskManager(TaskManager):
                     print_("Evaluation set is already available.")
             elif eval_strategy == "cv" or isinstance(eval_strategy, BaseCrossValidator):
                 print_("Starting cross validation")
-                self._cross_validate()
+                with quiet_verbosity():
+                    self._cross_validate()
                 print_("Finished cross-validation")
 
         print_("Beginning the main training phase")
@@ -262,10 +338,103 @@ class TabularTaskManager(TaskManager):
         """
         if isinstance(data, str):
             data = read_data(data)
+        if self._compiled is not None:
+            return self._compiled.run(np.asarray(data))[0].reshape(-1)
         if not isinstance(data, np.ndarray):
-            data = np.asarray(data, dtype=np.object_)
+            if isinstance(data, pd.DataFrame):
+                data = data.to_numpy(copy=False)
+            else:
+                data = np.asarray(data)
+            # object arrays are only needed when there are non-numerical features
+            if not (self._is_numeric_only and data.dtype.kind in "iufb"):
+                data = data.astype(np.object_, copy=False)
+        if self._is_numeric_only and data.dtype.kind in "iufb":
+            # numerical data is passed with the same dtype as during training
+            data = data.astype(np.float64, copy=False)
         return self._pipeline.predict(data)
 
+    def compile(self) -> TabularTaskManager:
+        """
+        Compiles the trained pipeline into an ONNX Runtime inference session.
+        Once compiled, `predict` runs the session instead of the python pipeline, which reduces the per call overhead.
+        The compiled session is discarded when the manager is trained again.
+
+        Returns
+        -------
+        TabularTaskManager
+            `self`
+        """
+        serialized_model = self.save_model()
+        self._compiled = ONNXRuntime(serialized_model.SerializeToString())
+        return self
+
+    def save(self, path: str) -> None:
+        """
+        Saves the trained pipeline (together with the metadata required for inference) using joblib.
+        The file is stored uncompressed, so that the numpy arrays inside can be memory-mapped by `from_file`.
+        Unlike `save_model`, the resulting file can only be loaded by falcon.
+
+        Parameters
+        ----------
+        path : str
+            path of the file
+        """
+        state = {
+            "task": self.task,
+            "pipeline": self._pipeline,
+            "mask": self._data[2],
+            "features": self.features,
+            "target": self.target,
+            "feature_names_to_save": self.feature_names_to_save,
+            "dataset_size": self.dataset_size,
+            "pipeline_class": self._pipeline_class,
+            "pipeline_init_kwargs": self._pipeline_init_kwargs,
+            "extra_pipeline_options": self._extra_pipeline_options,
+        }
+        joblib.dump(state, path, compress=0, protocol=5)
+
+    @classmethod
+    def from_file(cls, path: str) -> TabularTaskManager:
+        """
+        Loads the manager saved by `save`. The data preparation is skipped and the numpy arrays of the pipeline are memory-mapped in copy-on-write mode,
+        so the model parameters are only read from disk when they are accessed (the file itself is never modified).
+        The training data is not stored, hence the loaded manager can only be used for inference and evaluation (calling `train` raises an error).
+
+        Parameters
+        ----------
+        path : str
+            path of the file
+
+        Returns
+        -------
+        TabularTaskManager
+            loaded manager
+        """
+        state = joblib.load(path, mmap_mode="c")
+        manager = cls.__new__(cls)
+        manager.task = state["task"]
+        manager.features = state["features"]
+        manager.target = state["target"]
+        manager.feature_names_to_save = state["feature_names_to_save"]
+        manager.dataset_size = state["dataset_size"]
+        manager._data = (
+            np.empty((0, *state["dataset_size"][1:]), dtype=np.object_),
+            np.empty((0,), dtype=np.object_),
+            state["mask"],
+        )
+        manager._pipeline = state["pipeline"]
+        manager._pipeline_class = state["pipeline_class"]
+        manager._pipeline_init_kwargs = state["pipeline_init_kwargs"]
+        manager._extra_pipeline_options = state["extra_pipeline_options"]
+        manager._inference_only = True
+        manager._prep_cache = {}
+        manager._eval_set = None
+        manager._stored_cv_score = None
+        manager._compiled = None
+        manager.eval_strategy = None
+        manager.n_jobs = None
+        return manager
+
     def predict_stored_subset(self, subset: str = "train") -> npt.NDArray:
         """
         Makes a prediction on a stored subset (`train` or `eval`).
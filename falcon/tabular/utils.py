@@ -1,19 +1,100 @@
 from copy import deepcopy
+import hashlib
+import os
 import pandas as pd
-from typing import Union, Tuple, Optional, List, Callable, Dict
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from typing import Union, Tuple, Optional, List, Callable, Dict, Any
 import numpy as np
 from numpy import isin, typing as npt
 from falcon import types as ft
 from falcon.abstract.task_pipeline import Pipeline
 from falcon.types import ColumnTypes
-from sklearn.model_selection import RepeatedStratifiedKFold, RepeatedKFold
+from sklearn.model_selection import StratifiedKFold, KFold
 from sklearn.metrics import balanced_accuracy_score, r2_score
 from sklearn.model_selection._split import BaseCrossValidator
+from joblib import Parallel, delayed
 from falcon.tabular.reporting import print_classification_report, print_regression_report
 
+# number of folds used for pre-evaluation when no custom cross-validator is provided
+DEFAULT_CV_SPLITS = 3
+
+def _dedup_names(names: List[str]) -> List[str]:
+    # duplicated column names are renamed the same way as in `pd.read_csv` (`a`, `a.1`, `a.2`, ...)
+    header = set(names)
+    counts: Dict[str, int] = {}
+    deduped = []
+    for name in names:
+        original = name
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[original] = count + 1
+            name = f"{original}.{count}"
+            count = count + 1 if name in header else counts.get(name, 0)
+        counts[name] = count + 1
+        deduped.append(name)
+    return deduped
+
+
+def _temporal_columns(names: List[str], schema: pa.Schema) -> List[str]:
+    return [
+        name for name, type_ in zip(names, schema.types) if pa.types.is_temporal(type_)
+    ]
+
+
+def _read_csv(path: str) -> pd.DataFrame:
+    # pyarrow parses the file using multiple threads;
+    # empty strings are treated as nulls to match `pd.read_csv`
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=2**22)
+    parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+    convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+    # the header and the column types are inferred from the first block only
+    with pa_csv.open_csv(
+        path,
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=convert_options,
+    ) as reader:
+        schema = reader.schema
+    names = _dedup_names(
+        [name if name else f"Unnamed: {i}" for i, name in enumerate(schema.names)]
+    )
+    read_options.column_names = names
+    read_options.skip_rows = 1
+    # unlike `pd.read_csv`, pyarrow parses dates, times and timestamps;
+    # such columns are read as strings to keep their original values
+    convert_options.column_types = {
+        name: pa.string() for name in _temporal_columns(names, schema)
+    }
+    table = pa_csv.read_csv(
+        path,
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=convert_options,
+    )
+    temporal = _temporal_columns(names, table.schema)
+    if temporal:
+        # temporal columns that only appear after the first block require reading the file again
+        convert_options.column_types = {
+            **convert_options.column_types,
+            **{name: pa.string() for name in temporal},
+        }
+        table = pa_csv.read_csv(
+            path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+    return table.to_pandas()
+
+
 def read_data(path: str) -> pd.DataFrame:
     if path.endswith(".csv"):
-        data = pd.read_csv(path)
+        try:
+            data = _read_csv(path)
+        except pa.ArrowInvalid:
+            # files that pyarrow cannot parse (e.g. rows with missing fields) are read by pandas
+            data = pd.read_csv(path)
     elif path.endswith(".parquet"):
         data = pd.read_parquet(path)
     else:
@@ -22,6 +103,28 @@ def read_data(path: str) -> pd.DataFrame:
     return data
 
 
+def fingerprint_file(path: str, *extra: Any) -> bytes:
+    """
+    Computes a fingerprint of the data file, which can be used as a cache key.
+    The file is identified by its path, modification time and size, so its content is not read.
+
+    Parameters
+    ----------
+    path : str
+        path to data file
+    *extra : Any
+        additional values (e.g. arguments used for data preparation) to be included into the fingerprint
+
+    Returns
+    -------
+    bytes
+        fingerprint of the file
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, extra)
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).digest()
+
+
 def clean_data(
     data: Union[pd.DataFrame, npt.NDArray]
 ) -> Union[pd.DataFrame, npt.NDArray]:
@@ -137,27 +240,52 @@ def calculate_model_score(y: npt.NDArray, y_hat: npt.NDArray, task: str) -> floa
         return score
 
 
+def _fit_and_score(
+    pipeline: Pipeline,
+    X: npt.NDArray,
+    y: npt.NDArray,
+    train_index: npt.NDArray,
+    test_index: npt.NDArray,
+    task: str,
+) -> Dict[str, float]:
+    X_train, X_test = X[train_index], X[test_index]
+    y_train, y_test = y[train_index], y[test_index]
+    pipeline.fit(X_train, y_train)
+    pred = pipeline.predict(X_test)
+    report_fn = print_classification_report if task == 'tabular_classification' else print_regression_report
+    return report_fn(y_test, pred, silent = True)
+
+
 def tab_cv_score(
-    pipeline: Pipeline, X: npt.NDArray, y: npt.NDArray, task: str, cv: Optional[BaseCrossValidator] = None,
+    pipeline: Union[Pipeline, Callable[[], Pipeline]], X: npt.NDArray, y: npt.NDArray, task: str, cv: Optional[BaseCrossValidator] = None,
+    n_jobs: Optional[int] = None,
 ) -> Dict[str, float]:
+    # `pipeline` can either be a pipeline instance that is copied for each fold,
+    # or a factory that constructs a new (unfitted) pipeline, which avoids the deepcopy.
+    # The folds can be fitted in parallel using `n_jobs` workers (joblib semantics, None means sequential),
+    # the backend can be selected with `joblib.parallel_backend`;
+    # with process based backends, numerical arrays larger than `max_nbytes` are memory-mapped and shared between the workers instead of being pickled
     if cv is not None:
         if not isinstance(cv, BaseCrossValidator):
             raise ValueError("cv should be an instance of BaseCrossValidator")
         kf = cv
     elif task == "tabular_classification":
-        kf = RepeatedStratifiedKFold(n_splits=5, n_repeats=1)
+        kf = StratifiedKFold(n_splits=DEFAULT_CV_SPLITS, shuffle=True, random_state=42)
         y = y.astype(np.str_)
     else:
-        kf = RepeatedKFold(n_splits=5, n_repeats=1)
-    scores = []
-    for train_index, test_index in kf.split(X, y):
-        copied_pipeline = deepcopy(pipeline)
-        X_train, X_test = X[train_index], X[test_index]
-        y_train, y_test = y[train_index], y[test_index]
-        copied_pipeline.fit(X_train, y_train)
-        pred = copied_pipeline.predict(X_test)
-        report_fn = print_classification_report if task == 'tabular_classification' else print_regression_report
-        scores.append(report_fn(y_test, pred, silent = True))
+        kf = KFold(n_splits=DEFAULT_CV_SPLITS, shuffle=True, random_state=42)
+    X, y = np.ascontiguousarray(X), np.ascontiguousarray(y)
+    scores = Parallel(n_jobs=n_jobs, max_nbytes="100M")(
+        delayed(_fit_and_score)(
+            pipeline() if callable(pipeline) else deepcopy(pipeline),
+            X,
+            y,
+            train_index,
+            test_index,
+            task,
+        )
+        for train_index, test_index in kf.split(X, y)
+    )
     mean_scores = {}
     for key in scores[0].keys():
         mean_scores[key] = np.mean([score[key] for score in scores])
@@ -8,6 +8,7 @@ import re
 NUM_CAT_THRESHOLD: int = 10
 HIGH_CARD_THRESHOLD: int = 100
 NP_NUMERIC_TYPES = (int, float, np.int32, np.int64, np.float32, np.float64)
+NP_NUMERIC_KINDS = "iufb"
 REGEX_MAYBE_DATE = r"[0-9]+[/-][0-9]+[/-][0-9]+"
 # not strictly valid, but should be sufficient
 REGEX_UTC_LIKE = r"[0-9]+[-][0-9]{2}[-][0-9]{2}[ T]{1}[0-9]{2}[:][0-9]{2}[:][0-9]{2}Z?"
@@ -33,10 +34,15 @@ def determine_column_types(data: npt.NDArray) -> List[ColumnTypes]:
     mask: List[ColumnTypes] = []
     tmp_df: pd.DataFrame = pd.DataFrame(data).infer_objects()
     # print(tmp_df.dtypes.apply(lambda x: x.name).to_dict())
+    # columns with a numerical (or boolean) dtype after inference do not have to be checked cell by cell
+    numeric_dtypes = tmp_df.dtypes.map(lambda d: d.kind in NP_NUMERIC_KINDS).to_numpy()
     for col in range(tmp_df.shape[-1]):
         determined_type = None
-        if tmp_df.iloc[:, col].map(lambda x: isinstance(x, NP_NUMERIC_TYPES)).all():
-            if len(tmp_df.iloc[:, col].unique().tolist()) > NUM_CAT_THRESHOLD:
+        if (
+            numeric_dtypes[col]
+            or tmp_df.iloc[:, col].map(lambda x: isinstance(x, NP_NUMERIC_TYPES)).all()
+        ):
+            if tmp_df.iloc[:, col].nunique(dropna=False) > NUM_CAT_THRESHOLD:
                 determined_type = ColumnTypes.NUMERIC_REGULAR
             else:
                 determined_type = ColumnTypes.CAT_LOW_CARD
@@ -1,12 +1,13 @@
 import os
 import sys
 import warnings
+from contextlib import contextmanager
 from falcon.runtime import ONNXRuntime
 from typing import List, Optional, Dict
 from typing import List, Tuple, Optional
 from numpy import typing as npt
 import numpy as np
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterator, Union
 
 
 def run_model(model_path: str, X: npt.NDArray) -> Union[List[npt.NDArray], np.ndarray]:
@@ -38,15 +39,48 @@ def run_onnx(
     return runtime.run(X, outputs=outputs)
 
 
+# the environment variable is read once on import and is kept in sync by `set_verbosity_level`,
+# so that the subprocesses (e.g. joblib workers) inherit the current level
+# any value other than "1" is treated as "not verbose"
+_VERBOSITY_LEVEL: str = "1" if os.getenv("FALCON_VERBOSITY_LEVEL", "1") == "1" else "0"
+
+
 def set_verbosity_level(level: int = 1) -> None:
+    """
+    Sets the verbosity level. The `FALCON_VERBOSITY_LEVEL` environment variable is only read when falcon is imported,
+    changing it afterwards has no effect, this function should be used instead.
+
+    Parameters
+    ----------
+    level : int, optional
+        1 to print the progress messages, 0 to disable them, by default 1
+    """
+    global _VERBOSITY_LEVEL
     if level not in {0, 1}:
         level = 0
-    os.environ["FALCON_VERBOSITY_LEVEL"] = str(level)
+    _VERBOSITY_LEVEL = str(level)
+    os.environ["FALCON_VERBOSITY_LEVEL"] = _VERBOSITY_LEVEL
+
+
+def get_verbosity_level() -> int:
+    return int(_VERBOSITY_LEVEL)
+
+
+@contextmanager
+def quiet_verbosity() -> Iterator[None]:
+    """
+    Temporarily sets the verbosity level to 0. The previous level is restored on exit, even if an exception was raised.
+    """
+    old_verbosity_level = get_verbosity_level()
+    set_verbosity_level(0)
+    try:
+        yield
+    finally:
+        set_verbosity_level(old_verbosity_level)
 
 
 def print_(*args: Any) -> None:
-    verbosity_level = os.getenv("FALCON_VERBOSITY_LEVEL", "1")
-    if verbosity_level == "1":
+    if _VERBOSITY_LEVEL == "1":
         for a in args:
             print(a)
 
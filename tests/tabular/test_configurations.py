@@ -0,0 +1,62 @@
+from falcon.tabular.configurations import (
+    _CONFIG_NAMES,
+    _CONFIG_TABLE,
+    get_config,
+    get_pipeline_constructor,
+    TABULAR_CLASSIFICATION_CONFIGURATIONS,
+)
+from falcon.task_configurations import get_task_configuration
+from dataclasses import FrozenInstanceError
+import pytest
+
+
+def test_get_config_is_memoized():
+    config = get_config("tabular_classification", "SuperLearner.mini")
+    assert config is get_config("tabular_classification", "SuperLearner.mini")
+    assert config.to_dict() == TABULAR_CLASSIFICATION_CONFIGURATIONS["SuperLearner.mini"]
+    with pytest.raises(FrozenInstanceError):
+        config.pipeline = None
+    with pytest.raises(TypeError):
+        config.extra_pipeline_options["learner"] = None
+
+
+def test_get_config_unknown():
+    with pytest.raises(KeyError):
+        get_config("tabular_classification", "unknown")
+    with pytest.raises(ValueError, match="Unknown task"):
+        get_config("unknown_task", "SuperLearner")
+
+
+def test_registry_returns_copies():
+    config = get_task_configuration("tabular_regression", "SuperLearner.mini")
+    config["extra_pipeline_options"]["learner_kwargs"]["cv"] = 2
+    config_ = get_task_configuration("tabular_regression", "SuperLearner.mini")
+    assert config_["extra_pipeline_options"]["learner_kwargs"]["cv"] == 10
+
+
+def test_pipeline_constructor_is_shared():
+    constructor = get_pipeline_constructor("tabular_regression", "PlainLearner.hgbt")
+    assert constructor is get_pipeline_constructor("tabular_regression", "PlainLearner.hgbt")
+    config = get_config("tabular_regression", "PlainLearner.hgbt")
+    assert constructor.func is config.pipeline
+    assert constructor.keywords["learner"] is config.extra_pipeline_options["learner"]
+
+
+def test_config_table():
+    assert list(_CONFIG_NAMES) == list(TABULAR_CLASSIFICATION_CONFIGURATIONS)
+    config = get_config("tabular_regression", "OptunaLearner.hgbt")
+    assert _CONFIG_TABLE["tabular_regression"][_CONFIG_NAMES["OptunaLearner.hgbt"]] is config
+
+
+def test_config_lists_are_frozen():
+    config = get_config("tabular_classification", "SuperLearner.mid")
+    base_estimators = config.extra_pipeline_options["learner_kwargs"]["base_estimators"]
+    with pytest.raises(AttributeError):
+        base_estimators.append(None)
+    with pytest.raises(TypeError):
+        base_estimators[0][2]["key"] = None
+    thawed = config.to_dict()["extra_pipeline_options"]["learner_kwargs"]["base_estimators"]
+    assert isinstance(thawed, list) and isinstance(thawed[0], tuple)
+    assert isinstance(thawed[0][2], dict)
+    thawed.append(None)
+    assert len(thawed) == len(base_estimators) + 1
@@ -0,0 +1,50 @@
+from falcon.tabular.utils import read_data
+import pandas as pd
+
+
+def _write(tmp_path, content):
+    path = str(tmp_path / "data.csv")
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+def test_read_data_duplicated_columns(tmp_path):
+    path = _write(tmp_path, "a,a,a.1,a,t\n1,2,3,4,x\n5,6,7,8,\n")
+    data = read_data(path)
+    expected = pd.read_csv(path)
+    assert list(data.columns) == ["a", "a.2", "a.1", "a.3", "t"]
+    pd.testing.assert_frame_equal(data, expected)
+
+
+def test_read_data_keeps_dates_and_times_as_strings(tmp_path):
+    path = _write(
+        tmp_path, "d,t,s,x\n2020-01-02,10:11,2020-01-02 10:11:12,1.5\n2021-03-04,01:02:03,,2\n"
+    )
+    data = read_data(path)
+    expected = pd.read_csv(path)
+    assert data["d"].tolist() == ["2020-01-02", "2021-03-04"]
+    assert data["t"].tolist() == ["10:11", "01:02:03"]
+    pd.testing.assert_frame_equal(data, expected)
+
+
+def test_read_data_newlines_in_values(tmp_path):
+    # larger than a single block of the pyarrow reader
+    content = "i,text\n" + "".join(f'{i},"text {i}\nsecond line"\n' for i in range(400000))
+    path = _write(tmp_path, content)
+    data = read_data(path)
+    assert len(data) == 400000
+    assert data["text"].iloc[-1] == "text 399999\nsecond line"
+
+
+def test_read_data_short_rows(tmp_path):
+    path = _write(tmp_path, "a,b,c\n1,2\n3,4,5\n")
+    pd.testing.assert_frame_equal(read_data(path), pd.read_csv(path))
+
+
+def test_read_data_unnamed_columns(tmp_path):
+    path = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": [1.5, 2.5], "": ["x", "y"]}).to_csv(path)
+    data = read_data(path)
+    assert list(data.columns) == ["Unnamed: 0", "a", "Unnamed: 2"]
+    pd.testing.assert_frame_equal(data, pd.read_csv(path))
@@ -0,0 +1,170 @@
+from copy import deepcopy
+from falcon import initialize
+from falcon.tabular.learners import PlainLearner
+from falcon.tabular import TabularTaskManager
+from falcon.task_configurations import get_task_configuration
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _get_manager():
+    m = initialize(
+        task="tabular_regression",
+        data="tests/extra_files/cpu_act_sm.csv",
+        extra_pipeline_options={"learner": PlainLearner},
+        eval_strategy=None,
+    )
+    m.train()
+    return m
+
+
+def test_evaluation_data_is_cached(tmp_path):
+    m = _get_manager()
+    path = str(tmp_path / "test.csv")
+    pd.read_csv("tests/extra_files/cpu_act_sm.csv").iloc[:50].to_csv(path, index=False)
+    m.evaluate(path, silent=True)
+    prepared = m._prep_cache[next(iter(m._prep_cache))]
+    m.evaluate(path, silent=True)
+    assert len(m._prep_cache) == 1
+    assert m._prep_cache[next(iter(m._prep_cache))] is prepared
+    m.evaluate((m._data[0][:50], m._data[1][:50]), silent=True)
+    assert m._prep_cache[next(iter(m._prep_cache))] is prepared
+    pd.read_csv("tests/extra_files/cpu_act_sm.csv").iloc[:60].to_csv(path, index=False)
+    m.evaluate(path, silent=True)
+    assert len(m._prep_cache) == 1
+    assert m._prep_cache[next(iter(m._prep_cache))] is not prepared
+
+
+def test_compiled_predict():
+    m = _get_manager()
+    X = m._data[0]
+    pred = m.predict(X)
+    m.compile()
+    pred_ = m.predict(X)
+    assert pred_.shape == pred.shape
+    assert np.allclose(pred, pred_, rtol=1e-3)
+    m.train()
+    assert m._compiled is None
+
+
+def test_save_and_load(tmp_path):
+    m = _get_manager()
+    X = m._data[0]
+    path = str(tmp_path / "manager.joblib")
+    m.save(path)
+    m_ = TabularTaskManager.from_file(path)
+    assert np.array_equal(m.predict(X), m_.predict(X))
+    assert m_.evaluate((X, m._data[1]), silent=True) == m.evaluate((X, m._data[1]), silent=True)
+    assert type(m_._make_pipeline()) is type(m._pipeline)
+    with pytest.raises(RuntimeError):
+        m_.train()
+
+
+def test_save_and_load_super_learner(tmp_path):
+    config = get_task_configuration("tabular_classification", "SuperLearner.mini")
+    config["extra_pipeline_options"]["learner_kwargs"]["cv"] = 2
+    m = initialize(
+        task="tabular_classification",
+        data="tests/extra_files/iris.csv",
+        eval_strategy=None,
+        **config,
+    )
+    m.train()
+    X = m._data[0]
+    path = str(tmp_path / "manager.joblib")
+    m.save(path)
+    m_ = TabularTaskManager.from_file(path)
+    assert np.array_equal(m.predict(X), m_.predict(X))
+
+
+def test_manager_from_config_name(tmp_path):
+    m = initialize(
+        task="tabular_regression",
+        data="tests/extra_files/cpu_act_sm.csv",
+        config="PlainLearner.hgbt",
+        eval_strategy=None,
+    )
+    assert m._pipeline.learner is PlainLearner
+    deepcopy(m._pipeline)
+    m.train()
+    pred = m.predict(m._data[0])
+    assert pred.shape == (m._data[0].shape[0],)
+    path = str(tmp_path / "manager.joblib")
+    m.save(path)
+    assert np.array_equal(TabularTaskManager.from_file(path).predict(m._data[0]), pred)
+    with pytest.raises(ValueError):
+        initialize(
+            task="tabular_regression",
+            data="tests/extra_files/cpu_act_sm.csv",
+            config="unknown",
+        )
+    with pytest.raises(ValueError):
+        initialize(
+            task="tabular_regression",
+            data="tests/extra_files/cpu_act_sm.csv",
+            config=1,
+        )
+
+
+def test_manager_from_config_dict():
+    config = get_task_configuration("tabular_regression", "PlainLearner.hgbt")
+    m = initialize(
+        task="tabular_regression",
+        data="tests/extra_files/cpu_act_sm.csv",
+        config=config,
+        eval_strategy=None,
+    )
+    assert m._pipeline.learner is PlainLearner
+    with pytest.raises(ValueError):
+        initialize(
+            task="tabular_regression",
+            data="tests/extra_files/cpu_act_sm.csv",
+            config={**config, "eval_strategy": None},
+        )
+
+
+def test_numerical_features_keep_precision():
+    X = pd.DataFrame({"ts": 1.6e9 + 7 * np.arange(2000), "x": np.random.rand(2000)})
+    y = pd.Series(np.random.rand(2000))
+    m = initialize(
+        task="tabular_regression",
+        data=(X, y),
+        extra_pipeline_options={"learner": PlainLearner},
+        eval_strategy=None,
+    )
+    assert m._data[0].dtype == np.float64
+    assert len(np.unique(m._data[0][:, 0])) == 2000
+    m.train()
+    X_eval = m._prepare_data((X, y), training=False)[0]
+    assert np.array_equal(m._pipeline.predict(X_eval), m.predict(X))
+
+
+def test_cached_evaluation_restores_state(tmp_path):
+    m = _get_manager()
+    path = str(tmp_path / "test.csv")
+    data = pd.read_csv("tests/extra_files/cpu_act_sm.csv").iloc[:50]
+    data.to_csv(path, index=False)
+    m.evaluate(path, silent=True)
+    X_ = data.iloc[:40, :-1].add_prefix("b_")
+    m.evaluate((X_, data.iloc[:40, -1]), silent=True)
+    assert m.feature_names_to_save == list(X_.columns)
+    m.evaluate(path, silent=True)
+    assert m.feature_names_to_save == list(data.columns[:-1])
+    assert m.dataset_size == (50, data.shape[1] - 1)
+
+
+def test_parallel_cross_validation():
+    scores = []
+    for n_jobs in (None, 2):
+        m = initialize(
+            task="tabular_regression",
+            data="tests/extra_files/cpu_act_sm.csv",
+            extra_pipeline_options={"learner": PlainLearner},
+            eval_strategy="cv",
+            n_jobs=n_jobs,
+        )
+        assert m.n_jobs == n_jobs
+        m.train()
+        scores.append(m._stored_cv_score)
+    assert scores[0] == scores[1]
@@ -0,0 +1,24 @@
+from falcon.utils import quiet_verbosity, get_verbosity_level, set_verbosity_level
+import pytest
+import os
+import subprocess
+import sys
+
+
+def test_quiet_verbosity_restores_level():
+    set_verbosity_level(1)
+    with quiet_verbosity():
+        assert get_verbosity_level() == 0
+    assert get_verbosity_level() == 1
+    with pytest.raises(ValueError):
+        with quiet_verbosity():
+            raise ValueError()
+    assert get_verbosity_level() == 1
+
+
+def test_invalid_verbosity_env_value():
+    code = "from falcon.utils import quiet_verbosity, get_verbosity_level\n"
+    code += "with quiet_verbosity(): pass\n"
+    code += "assert get_verbosity_level() == 0"
+    env = {**os.environ, "FALCON_VERBOSITY_LEVEL": "debug"}
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)